@@ -1,9 +1,10 @@
 # app.py
+import hashlib
 import os
+from datetime import date
 import streamlit as st
-import time
 
-from report_builder import load_json_from_text, generate_pdf_bytes
+from report_builder import load_json_from_text, generate_pdf_cached
 
 st.set_page_config(page_title="RB Cyber Health Check", layout="wide")
 
@@ -14,9 +15,18 @@ if not os.path.exists(RB_LOGO_PATH):
     st.error("RB logo not found. Please add it at: assets/RB_logo.jpg")
     st.stop()
 st.image(RB_LOGO_PATH, width=220)
+
+# Characters that are unsafe (or awkward) in download file names
+FILENAME_TRANS = str.maketrans({c: "_" for c in ' /\\:*?"<>|'})
 st.title("RB Cyber Health Check Report Generator")
 
 
+@st.cache_data(show_spinner=False)
+def parse_upload(text):
+    # Cached on the raw upload text, so reruns with the same files skip re-parsing
+    return load_json_from_text(text)
+
+
 
 with st.sidebar:
     st.header("Report Inputs")
@@ -34,14 +44,21 @@ with col1:
 with col2:
     ssl_file = st.file_uploader(("SSL Labs Data"), type=["txt", "json"])
 
-if hibp_file and ssl_file:
-    try:
-        hibp_text = hibp_file.read().decode("utf-8", errors="replace")
-        ssl_text = ssl_file.read().decode("utf-8", errors="replace")
+# Parse each file as soon as it is uploaded rather than once both are present.
+# parse_upload caches per upload, so when the second file lands only that one
+# still needs parsing. Raw bytes go straight to the JSON parser (no decode copy).
+try:
+    hibp_text = hibp_file.getvalue() if hibp_file else None
+    ssl_text = ssl_file.getvalue() if ssl_file else None
 
-        hibp = load_json_from_text(hibp_text)
-        ssl = load_json_from_text(ssl_text)
+    hibp = parse_upload(hibp_text) if hibp_file else None
+    ssl = parse_upload(ssl_text) if ssl_file else None
+except Exception as e:
+    st.error(f"Failed to parse/generate report: {e}")
+    st.stop()
 
+if hibp_file and ssl_file:
+    try:
         st.success("Files parsed successfully.")
 
         #with st.expander("Preview parsed HIBP JSON"):
@@ -49,12 +66,24 @@ if hibp_file and ssl_file:
 
         #with st.expander("Preview parsed SSL Labs JSON"):
             #st.json(ssl)
-        
-        if st.button("Generate PDF Report"):
-             with st.spinner("🔐 AI is analysing HIBP and SSL Labs data and generating the Cyber Health Check report..."):
-                time.sleep(5)  # simulate AI processing time
-    
-                pdf_bytes = generate_pdf_bytes(
+
+        # Streamlit reruns the whole script on every interaction (including the
+        # download click), so keep the latest PDF keyed by a hash of the inputs.
+        # Only one is kept per session; generate_pdf_cached keeps older ones.
+        # Uploads are hashed as raw bytes, without building a repr/copy of them
+        hasher = hashlib.blake2b()
+        # A blank review date prints today's date, so key on that rather than ""
+        reviewed = last_reviewed.strip() or date.today().isoformat()
+        fields = (business_name, email, website, classification, reviewed)
+        for part in [f.encode() for f in fields] + [hibp_text, ssl_text]:
+            hasher.update(len(part).to_bytes(8, "little"))  # length prefix keeps fields apart
+            hasher.update(part)
+        cache_key = hasher.hexdigest()
+
+        last_pdf = st.session_state.get("last_pdf")
+        if st.button("Generate PDF Report") and (last_pdf is None or last_pdf[0] != cache_key):
+             with st.spinner("🔐 Generating the Cyber Health Check report..."):
+                last_pdf = st.session_state["last_pdf"] = cache_key, generate_pdf_cached(
                     business_name=business_name.strip() or "TBD",
                     email=email.strip() or "TBD",
                     website=website.strip() or "TBD",
@@ -64,15 +93,17 @@ if hibp_file and ssl_file:
                     last_reviewed=last_reviewed.strip() or None,
                     logo_path=RB_LOGO_PATH,  # <-- always RB_logo.jpg
                  )
-            
-                st.success("📄 Your Cyber Health Check Report is ready to download")
-                 
-                st.download_button(
-                    "Download Report (PDF)",
-                    data=pdf_bytes,
-                    file_name=f"Cyber_Health_Check_Report_{(business_name or 'TBD').replace(' ', '_')}.pdf",
-                    mime="application/pdf",
-                    )
+
+        pdf_bytes = last_pdf[1] if last_pdf and last_pdf[0] == cache_key else None
+        if pdf_bytes:
+            st.success("📄 Your Cyber Health Check Report is ready to download")
+
+            st.download_button(
+                "Download Report (PDF)",
+                data=pdf_bytes,
+                file_name=f"Cyber_Health_Check_Report_{(business_name or 'TBD').translate(FILENAME_TRANS)}.pdf",
+                mime="application/pdf",
+                )
 
     except Exception as e:
         st.error(f"Failed to parse/generate report: {e}")
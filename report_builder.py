@@ -1,266 +1,1077 @@
 # report_builder.py
 from __future__ import annotations
 
+import copy
+import hashlib
 import io
 import json
-from dataclasses import dataclass
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
+from PIL import Image as PILImage
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.utils import ImageReader
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
+    Flowable,
+    ListFlowable,
+    ListItem,
     SimpleDocTemplate,
     Paragraph,
     Spacer,
     Table,
     TableStyle,
     PageBreak,
-    KeepTogether,
 )
 from reportlab.pdfgen import canvas
 
+try:
+    from orjson import OPT_NON_STR_KEYS, OPT_SORT_KEYS, dumps as _orjson_dumps, loads as _loads
+
+    _LOADS_TAKES_BUFFERS = True  # orjson also parses memoryview slices
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        try:
+            out = _orjson_dumps(obj, default=str, option=OPT_SORT_KEYS | OPT_NON_STR_KEYS)
+        except TypeError:  # e.g. integers beyond 64 bits
+            return json.dumps(obj, sort_keys=True, default=str).encode()
+        if b"null" in out:
+            # orjson writes NaN/Infinity as null too; json keeps them apart
+            return json.dumps(obj, sort_keys=True, default=str).encode()
+        return out
+
+except ImportError:  # fall back to the next fastest parser available
+    _LOADS_TAKES_BUFFERS = False
+    try:
+        from ujson import loads as _loads
+    except ImportError:
+        _loads = json.loads
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+# -----------------------------
+# Page geometry
+# -----------------------------
+_PAGE_W, _PAGE_H = A4
+_LEFT_M = 20 * mm
+_RIGHT_M = 20 * mm
+_TOP_M = 28 * mm
+_BOT_M = 18 * mm
+_RIGHT_X = _PAGE_W - _RIGHT_M  # right edge for right-aligned header/footer text
+_HEADER_Y1 = _PAGE_H - 15 * mm  # report title
+_HEADER_Y2 = _PAGE_H - 22 * mm  # version/classification line, logo bottom
+_FOOTER_Y1 = 12 * mm
+_FOOTER_Y2 = 6 * mm
+_LOGO_W = 28 * mm
+_LOGO_H = 14 * mm
+
 
 # -----------------------------
 # Robust JSON loading
 # -----------------------------
-def _strip_to_json(text: str) -> str:
+def _strip_to_json(text: Union[str, bytes]) -> Union[str, bytes, memoryview]:
     """
     Some exports include comment headers. We parse from first '{'.
+    Works on raw bytes too, so uploads don't need decoding first.
     """
-    i = text.find("{")
+    i = text.find(b"{" if isinstance(text, bytes) else "{")
     if i == -1:
         raise ValueError("No JSON object found in input text.")
+    if i and isinstance(text, bytes) and _LOADS_TAKES_BUFFERS:
+        return memoryview(text)[i:]  # skip the header without copying the payload
     return text[i:]
 
 
-def _normalize_extended_json(obj: Any) -> Any:
+def _unwrap_extended(obj: Any) -> Any:
     """
-    Handles extended JSON formats like:
-      {"$date": "..."} or {"$numberLong": "..."}
+    Returns the plain value for {"$date": ...} / {"$numberLong": ...} wrappers,
+    or obj unchanged.
     """
-    if isinstance(obj, dict):
-        if "$date" in obj and len(obj) == 1:
+    if isinstance(obj, dict) and len(obj) == 1:
+        if "$date" in obj:
             return obj["$date"]
-        if "$numberLong" in obj and len(obj) == 1:
+        if "$numberLong" in obj:
             try:
                 return int(obj["$numberLong"])
             except Exception:
                 return obj["$numberLong"]
-        return {k: _normalize_extended_json(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_normalize_extended_json(x) for x in obj]
     return obj
 
 
-def load_json_from_text(text: str) -> Dict[str, Any]:
+def _normalize_extended_json(obj: Any) -> Any:
+    """
+    Handles extended JSON formats like:
+      {"$date": "..."} or {"$numberLong": "..."}
+
+    Walks the tree with an explicit stack and replaces wrappers in place, so
+    containers are never copied and deep payloads can't hit the recursion limit.
+    """
+    unwrapped = _unwrap_extended(obj)
+    if unwrapped is not obj:
+        return unwrapped
+
+    stack = [obj] if isinstance(obj, (dict, list)) else []
+    while stack:
+        node = stack.pop()
+        for k, v in (node.items() if isinstance(node, dict) else enumerate(node)):
+            if isinstance(v, (dict, list)):
+                unwrapped = _unwrap_extended(v)
+                if unwrapped is v:
+                    stack.append(v)
+                else:
+                    node[k] = unwrapped
+    return obj
+
+
+def _may_have_extended(text: Union[str, bytes]) -> bool:
+    """
+    Cheap pre-check on the raw text: every extended-JSON wrapper key starts
+    with '"$' (or an escaped \\u0024). Plain exports skip the normalisation walk.
+    """
+    if isinstance(text, str):
+        return '"$' in text or "\\u0024" in text
+    return b'"$' in text or b"\\u0024" in text
+
+
+# orjson reads integers beyond 64 bits as floats. Such a number is 20+ digits
+# right after a separator or '-' (long fractions like 0.000123... follow '.').
+# Mapping digits to '0' and separators to ',' turns the check into one
+# substring search, far cheaper than a regex scan of the whole upload.
+_WIDE_INT_TABLE = bytes.maketrans(b"123456789:[ \n\r\t-", b"000000000,,,,,,,")
+_WIDE_INT_MARK = b"," + b"0" * 20
+
+
+def _may_have_wide_int(text: Union[str, bytes]) -> bool:
+    if isinstance(text, str):
+        text = text.encode("utf-8", "replace")
+    return _WIDE_INT_MARK in text.translate(_WIDE_INT_TABLE)
+
+
+def _loads_stdlib(raw: Union[str, bytes, memoryview]) -> Any:
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    try:
+        return json.loads(raw)
+    except UnicodeDecodeError:
+        # Not valid UTF-8; parse it the way a lenient text decode would
+        return json.loads(str(raw, "utf-8", "replace"))
+
+
+def load_json_from_text(text: Union[str, bytes]) -> Dict[str, Any]:
     raw = _strip_to_json(text)
-    data = json.loads(raw)
-    return _normalize_extended_json(data)
+    if _may_have_wide_int(text):
+        data = _loads_stdlib(raw)
+    else:
+        try:
+            data = _loads(raw)
+        except ValueError:
+            # The fast parsers are stricter than json (NaN, Infinity, invalid
+            # UTF-8), so anything the stdlib accepts still parses
+            data = _loads_stdlib(raw)
+    return _normalize_extended_json(data) if _may_have_extended(text) else data
 
 
 # -----------------------------
 # Findings model
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class Finding:
     number: int
     title: str
     status: str  # PASS / RISK / N/A
     headline: str
     summary: str
-    details: List[Tuple[str, str]]
+    details: List[Tuple[str, Any]]  # values are stringified when drawn
+    status_hex: str = field(init=False, repr=False)  # colour for markup, e.g. "0x2e7d32"
+
+    def __post_init__(self):
+        self.status_hex = _STATUS_HEX.get(self.status, _STATUS_HEX["N/A"])
+
+
+_STATUS_COLORS = {
+    "PASS": colors.HexColor("#2E7D32"),
+    "RISK": colors.HexColor("#C62828"),
+    "N/A": colors.HexColor("#616161"),
+}
+_STATUS_HEX = {status: color.hexval() for status, color in _STATUS_COLORS.items()}
 
 
 def _status_color(status: str) -> colors.Color:
-    if status == "PASS":
-        return colors.HexColor("#2E7D32")
-    if status == "RISK":
-        return colors.HexColor("#C62828")
-    return colors.HexColor("#616161")
+    return _STATUS_COLORS.get(status, _STATUS_COLORS["N/A"])
 
 
 # -----------------------------
 # Build findings from your files
 # -----------------------------
-def build_findings(hibp: Dict[str, Any], ssl: Dict[str, Any]) -> List[Finding]:
-    findings: List[Finding] = []
+_HEADLINES = {"PASS": "Great News!", "RISK": "Bad News!", "N/A": "N/A"}
+
+
+def _or_na(value: Any) -> Any:
+    return "N/A" if value is None else value
 
-    # 1) Account compromise (HIBP)
-    hibp_summary = hibp.get("summary", {})
+
+def _account_finding(number: int, hibp: Dict[str, Any]) -> Finding:
+    """Account compromise (HIBP)."""
+    hibp_summary = hibp.get("summary") or {}
+    hibp_raw = hibp.get("raw") or {}
     breaches_found = int(hibp_summary.get("breaches_found", 0) or 0)
     pastes_found = int(hibp_summary.get("pastes_found", 0) or 0)
     is_pwned = bool(hibp_summary.get("is_pwned", False))
 
     breaches = [
-        b.get("Name")
-        for b in (hibp.get("raw", {}).get("breaches") or [])
-        if isinstance(b, dict)
+        b["Name"]
+        for b in (hibp_raw.get("breaches") or ())
+        if isinstance(b, dict) and b.get("Name")
     ]
-    breaches = [x for x in breaches if x]
 
     status = "RISK" if is_pwned else "PASS"
-    headline = "Bad News!" if is_pwned else "Great News!"
     summary = (
         "Our dark web research indicates your email address "
         f"{'has' if is_pwned else 'has not'} been recorded as part of "
         f"{'one or more' if is_pwned else 'any'} data breaches."
     )
 
-    findings.append(
-        Finding(
-            number=1,
-            title="Account compromise",
-            status=status,
-            headline=headline,
-            summary=summary,
-            details=[
-                ("Email", str(hibp.get("email", "N/A"))),
-                ("Breaches found", str(breaches_found)),
-                ("Pastes found", str(pastes_found)),
-                ("Breaches", ", ".join(breaches) if breaches else "None"),
-                #("Breaches",","<br/>.join(breaches) if breaches else "None",
-                #("Breaches", ","<br/>.join(breaches) if breaches else "None"),
-                ("Scan date", str(hibp.get("scanned_at", "N/A"))),
-            ],
-        )
+    return Finding(
+        number=number,
+        title="Account compromise",
+        status=status,
+        headline=_HEADLINES[status],
+        summary=summary,
+        details=[
+            ("Email", hibp.get("email", "N/A")),
+            ("Breaches found", breaches_found),
+            ("Pastes found", pastes_found),
+            ("Breaches", ", ".join(breaches) if breaches else "None"),
+            #("Breaches",","<br/>.join(breaches) if breaches else "None",
+            #("Breaches", ","<br/>.join(breaches) if breaches else "None"),
+            ("Scan date", hibp.get("scanned_at", "N/A")),
+        ],
     )
 
-    
-    # 2) Website encryption (SSL Labs)
+
+def _encryption_finding(
+    number: int,
+    ssl: Dict[str, Any],
+    ssl_raw: Dict[str, Any],
+    details_obj: Dict[str, Any],
+    protocol_list: str,
+) -> Finding:
+    """Website encryption (SSL Labs)."""
     grade = ssl.get("grade") or "N/A"
-    domain = ssl.get("domain") or ssl.get("raw", {}).get("host") or "N/A"
+    domain = ssl.get("domain") or ssl_raw.get("host") or "N/A"
     ip_addr = ssl.get("ip_address") or "N/A"
     scanned_at = ssl.get("scanned_at") or "N/A"
 
     if grade in ("A+", "A"):
         status = "PASS"
-        headline = "Great News!"
         summary = "Our research indicates your website has a strong TLS configuration."
     elif grade == "N/A":
         status = "N/A"
-        headline = "N/A"
         summary = "No SSL Labs grade was available in the provided data."
     else:
         status = "RISK"
-        headline = "Bad News!"
         summary = "Our research indicates your website TLS grade is below A, which may increase exposure to attack."
 
-    endpoints = (ssl.get("raw", {}) or {}).get("endpoints") or []
-    ep0 = endpoints[0] if endpoints else {}
-    details_obj = (ep0.get("details") or {}) if isinstance(ep0, dict) else {}
-
-    protocols = details_obj.get("protocols") or []
-    protocol_names: List[str] = []
-    for p in protocols:
-        if isinstance(p, dict):
-            protocol_names.append(f"{p.get('name', 'TLS')} {p.get('version', '')}".strip())
-    protocol_list = ", ".join(protocol_names) if protocol_names else "N/A"
-
-    findings.append(
-        Finding(
-            number=2,
-            title="Website encryption",
-            status=status,
-            headline=headline,
-            summary=summary,
-            details=[
-                ("Domain", domain),
-                ("IP address", ip_addr),
-                ("Overall grade", str(grade)),
-                ("Supported protocols", protocol_list),
-                ("BEAST vulnerability flag", str(details_obj.get("vulnBeast")) if details_obj.get("vulnBeast") is not None else "N/A"),
-                ("OCSP stapling", str(details_obj.get("ocspStapling")) if details_obj.get("ocspStapling") is not None else "N/A"),
-                ("RC4 supported", str(details_obj.get("supportsRc4")) if details_obj.get("supportsRc4") is not None else "N/A"),
-                ("Scan date", str(scanned_at)),
-            ],
-        )
+    return Finding(
+        number=number,
+        title="Website encryption",
+        status=status,
+        headline=_HEADLINES[status],
+        summary=summary,
+        details=[
+            ("Domain", domain),
+            ("IP address", ip_addr),
+            ("Overall grade", grade),
+            ("Supported protocols", protocol_list),
+            ("BEAST vulnerability flag", _or_na(details_obj.get("vulnBeast"))),
+            ("OCSP stapling", _or_na(details_obj.get("ocspStapling"))),
+            ("RC4 supported", _or_na(details_obj.get("supportsRc4"))),
+            ("Scan date", scanned_at),
+        ],
     )
 
-    # 3) Legacy TLS (1.0/1.1)
-    has_tls10 = any("1.0" in x for x in protocol_names)
-    has_tls11 = any("1.1" in x for x in protocol_names)
+
+def _legacy_tls_finding(number: int, protocol_names: List[str], protocol_list: str) -> Finding:
+    """Legacy TLS (1.0/1.1)."""
+    has_tls10 = has_tls11 = False
+    for name in protocol_names:
+        if "1.0" in name:
+            has_tls10 = True
+        elif "1.1" in name:
+            has_tls11 = True
     legacy = has_tls10 or has_tls11
 
     if not protocol_names:
         status = "N/A"
-        headline = "N/A"
         summary = "No protocol information was available in the provided data."
     else:
         status = "RISK" if legacy else "PASS"
-        headline = "Bad News!" if legacy else "Great News!"
         summary = (
             "Our research indicates your website supports legacy TLS versions (1.0/1.1), which can reduce transport security."
             if legacy
             else "Our research indicates your website does not advertise legacy TLS 1.0/1.1 support."
         )
 
-    findings.append(
-        Finding(
-            number=3,
-            title="Website encryption downgrade (legacy TLS)",
-            status=status,
-            headline=headline,
-            summary=summary,
-            details=[
-                ("TLS 1.0 supported", str(has_tls10) if protocol_names else "N/A"),
-                ("TLS 1.1 supported", str(has_tls11) if protocol_names else "N/A"),
-                ("Supported protocols", protocol_list),
-            ],
-        )
+    return Finding(
+        number=number,
+        title="Website encryption downgrade (legacy TLS)",
+        status=status,
+        headline=_HEADLINES[status],
+        summary=summary,
+        details=[
+            ("TLS 1.0 supported", has_tls10 if protocol_names else "N/A"),
+            ("TLS 1.1 supported", has_tls11 if protocol_names else "N/A"),
+            ("Supported protocols", protocol_list),
+        ],
     )
 
-    return findings
+
+def build_findings(hibp: Dict[str, Any], ssl: Dict[str, Any]) -> List[Finding]:
+    # Both TLS findings read the first endpoint's protocol list; extract it once
+    ssl_raw = ssl.get("raw") or {}
+    endpoints = ssl_raw.get("endpoints") or ()
+    ep0 = endpoints[0] if endpoints else {}
+    details_obj = (ep0.get("details") or {}) if isinstance(ep0, dict) else {}
+
+    protocols = details_obj.get("protocols") or []
+    protocol_names: List[str] = []
+    for p in protocols:
+        if isinstance(p, dict):
+            protocol_names.append(f"{p.get('name', 'TLS')} {p.get('version', '')}".strip())
+    protocol_list = ", ".join(protocol_names) if protocol_names else "N/A"
+
+    return [
+        _account_finding(1, hibp),
+        _encryption_finding(2, ssl, ssl_raw, details_obj, protocol_list),
+        _legacy_tls_finding(3, protocol_names, protocol_list),
+    ]
 
 
 # -----------------------------
 # Header/footer with RB logo (top-left)
 # -----------------------------
-def _draw_header_footer(
-    c: canvas.Canvas,
-    doc,
-    report_title: str,
-    classification: str,
-    last_reviewed: str,
-    logo_path: Optional[str],
-):
-    width, height = A4
-
-    # Logo on top-left of every page
-    if logo_path:
+# Logo is drawn in a _LOGO_W x _LOGO_H box; ~2x that at 100 DPI is plenty of detail
+_LOGO_MAX_PX = (220, 110)
+
+
+def _prepare_logo(logo: Union[str, BinaryIO]) -> bytes:
+    """
+    Oversized logos are shrunk to the drawn size before embedding, so the PDF
+    doesn't carry (and ReportLab doesn't process) pixels nobody will see.
+    Takes a path or an in-memory file (e.g. an upload), so nothing has to be
+    written to disk first.
+    """
+    with PILImage.open(logo) as img:
+        if img.width <= _LOGO_MAX_PX[0] and img.height <= _LOGO_MAX_PX[1]:
+            return _read_logo(logo)
+
         try:
-            logo = ImageReader(logo_path)
-            c.drawImage(
-                logo,
-                20 * mm,
-                height - 22 * mm,
-                width=28 * mm,
-                height=14 * mm,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-        except Exception:
-            pass
+            img.thumbnail(_LOGO_MAX_PX)
+            out = io.BytesIO()
+            if img.mode in ("RGB", "L"):
+                img.save(out, format="JPEG", quality=90)  # embedded as-is by ReportLab
+            elif "A" in img.getbands() or "transparency" in img.info:
+                img.convert("RGBA").save(out, format="PNG")  # keeps transparency
+            else:
+                # CMYK, 16-bit greyscale etc. can't all be written as PNG
+                img.convert("RGB").save(out, format="JPEG", quality=90)
+        except (OSError, ValueError):
+            # Mode Pillow can't re-encode; ReportLab embeds the original fine
+            return _read_logo(logo)
+    return out.getvalue()
+
+
+def _read_logo(logo: Union[str, BinaryIO]) -> bytes:
+    if isinstance(logo, str):
+        with open(logo, "rb") as fh:
+            return fh.read()
+    logo.seek(0)  # Pillow has read the header
+    return logo.read()
+
+
+@lru_cache(maxsize=32)
+def _cached_logo(logo_path: str) -> bytes:
+    return _prepare_logo(logo_path)
+
+
+def _load_logo(logo: Union[str, BinaryIO]) -> ImageReader:
+    """
+    Logos given by path are read and resized once per process. Each report
+    still gets its own ImageReader: ReportLab seeks/reads the reader's file
+    handle while embedding, so one reader can't be shared between threads.
+    """
+    data = _cached_logo(logo) if isinstance(logo, str) else _prepare_logo(logo)
+    return ImageReader(io.BytesIO(data))
+
+
+class _HeaderFooter:
+    """
+    Page callback for the logo, header and footer. Everything except the page
+    number is fixed for the document, so strings and right-aligned positions
+    are worked out once here instead of on every page.
+    """
+
+    def __init__(
+        self,
+        report_title: str,
+        version_line: str,
+        reviewed_line: str,
+        logo: Optional[ImageReader],
+    ):
+        self.logo = logo
+        self.report_title = report_title
+        self.version_line = version_line
+        self.reviewed_line = reviewed_line
+        self.title_x = _RIGHT_X - stringWidth(report_title, "Helvetica", 10)
+        self.version_x = _RIGHT_X - stringWidth(version_line, "Helvetica", 9)
+
+    def __call__(self, c: canvas.Canvas, doc):
+        # Logo on top-left of every page
+        if self.logo is not None:
+            try:
+                c.drawImage(
+                    self.logo,
+                    _LEFT_M,
+                    _HEADER_Y2,
+                    width=_LOGO_W,
+                    height=_LOGO_H,
+                    preserveAspectRatio=True,
+                    mask="auto",
+                )
+            except Exception:
+                pass
+
+        # Header text (right)
+        c.setFont("Helvetica", 10)
+        c.drawString(self.title_x, _HEADER_Y1, self.report_title)
+        c.setFont("Helvetica", 9)
+        c.drawString(self.version_x, _HEADER_Y2, self.version_line)
+
+        # Footer (same 9pt font as the version line)
+        c.drawString(_LEFT_M, _FOOTER_Y1, self.reviewed_line)
+        c.drawString(_LEFT_M, _FOOTER_Y2, "Document Owner: RB Consultancy Ltd")
+        c.drawRightString(_RIGHT_X, _FOOTER_Y1, f"Page {doc.page}")
+
+
+# -----------------------------
+# Cover page (drawn directly on the canvas)
+# -----------------------------
+def _draw_cover(c: canvas.Canvas, business_name: str):
+    """
+    The cover is fixed text, so it is drawn straight onto page 1 rather than
+    laid out as flowables. Positions match the H1 style in the body frame.
+    """
+    x = _LEFT_M + 6  # left margin + frame padding
+    y = _PAGE_H - _TOP_M - 6 - 25 * mm - 26  # top margin, padding, spacer, font size
+    max_width = _PAGE_W - _LEFT_M - _RIGHT_M - 12
+
+    c.setFont("Helvetica-Bold", 26)
+    for text in ("Cyber Health Check Report", business_name):
+        for line in simpleSplit(text, "Helvetica-Bold", 26, max_width):
+            c.drawString(x, y, line)
+            y -= 22  # H1 leading
+        y -= 14  # H1 spaceAfter
+
+
+# -----------------------------
+# Detail table (drawn directly on the canvas)
+# -----------------------------
+class _DetailTable(Flowable):
+    """
+    Two-column Metric/Value table for the detailed findings pages.
+
+    Laid out once in __init__ and drawn with plain canvas calls, so these small
+    fixed tables skip Platypus Table sizing. Long values wrap within their
+    column; a table taller than the frame splits between rows (or between the
+    lines of a long value) and repeats the header row on the next page.
+    """
 
-    # Header text (right)
-    c.setFont("Helvetica", 10)
-    c.drawRightString(width - 20 * mm, height - 15 * mm, report_title)
-    c.setFont("Helvetica", 9)
-    c.drawRightString(width - 20 * mm, height - 22 * mm, f"Version: 1.0  Classification: {classification}")
+    _PAD = 6
+    _HEADER_FONT = ("Helvetica-Bold", 10)
+    _BODY_FONT = ("Helvetica", 9)
+    _HEADER_BG = colors.HexColor("#EEEEEE")
+
+    def __init__(self, rows: List[Tuple[str, Any]], col_widths: Tuple[float, float]):
+        super().__init__()
+        self.hAlign = "CENTER"
+        self.col_widths = col_widths
+        self.width = sum(col_widths)
+        self._header = self._layout_row(self._HEADER_FONT, ("Metric", "Value"))
+        self._set_body([self._layout_row(self._BODY_FONT, row) for row in rows])
+
+    def _layout_row(self, font_spec: Tuple[str, int], row) -> List[List[str]]:
+        font, size = font_spec
+        return [
+            simpleSplit(str(text), font, size, w - 2 * self._PAD) or [""]
+            for text, w in zip(row, self.col_widths)
+        ]
+
+    def _set_body(self, body: List[List[List[str]]]):
+        self._body = body
+        self._rows = []
+        for font_spec, cells in [(self._HEADER_FONT, self._header)] + [(self._BODY_FONT, c) for c in body]:
+            font, size = font_spec
+            leading = size * 1.2
+            height = max(len(lines) for lines in cells) * leading + 2 * self._PAD
+            self._rows.append((font, size, leading, height, cells))
+        self.height = sum(r[3] for r in self._rows)
+
+    def _with_body(self, body: List[List[List[str]]]) -> "_DetailTable":
+        # A fresh flowable, not a copy: Platypus marks flowables it has
+        # postponed, and that state mustn't carry over to the split parts
+        part = _DetailTable([], self.col_widths)
+        part._set_body(body)
+        return part
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        room = availHeight - self._rows[0][3]
+        for i, (_, _, leading, height, cells) in enumerate(self._rows[1:]):
+            if height <= room:
+                room -= height
+                continue
+            # Row i doesn't fit: keep as many of its lines as do
+            n = int((room - 2 * self._PAD) // leading)
+            if n > 0:
+                head = self._body[:i] + [[lines[:n] or [""] for lines in cells]]
+                tail = [[lines[n:] or [""] for lines in cells]] + self._body[i + 1 :]
+            else:
+                head, tail = self._body[:i], self._body[i:]
+            if not head:
+                return []  # not even one line fits; move to the next frame
+            return [self._with_body(head), self._with_body(tail)]
+        return [self]
+
+    def draw(self):
+        c = self.canv
+        pad = self._PAD
+
+        # Header background
+        header_height = self._rows[0][3]
+        c.setFillColor(self._HEADER_BG)
+        c.rect(0, self.height - header_height, self.width, header_height, stroke=0, fill=1)
+        c.setFillColor(colors.black)
+
+        # Cell text (top-aligned)
+        row_lines = [self.height]
+        top = self.height
+        for font, size, leading, height, cells in self._rows:
+            c.setFont(font, size, leading)
+            x = 0
+            for lines, w in zip(cells, self.col_widths):
+                y = top - pad - size
+                for line in lines:
+                    c.drawString(x + pad, y, line)
+                    y -= leading
+                x += w
+            top -= height
+            row_lines.append(top)
+
+        # Grid
+        c.setStrokeColor(colors.grey)
+        c.setLineWidth(0.5)
+        col_lines = [0, self.col_widths[0], self.width]
+        c.grid(col_lines, row_lines)
 
-    # Footer
-    c.setFont("Helvetica", 9)
-    c.drawString(20 * mm, 12 * mm, f"Last Reviewed: {last_reviewed}")
-    c.drawString(20 * mm, 6 * mm, "Document Owner: RB Consultancy Ltd")
-    c.drawRightString(width - 20 * mm, 12 * mm, f"Page {doc.page}")
+
+# -----------------------------
+# Shared styles (built once at import)
+# -----------------------------
+_STYLES = getSampleStyleSheet()
+_STYLES.add(ParagraphStyle(name="H1", parent=_STYLES["Heading1"], fontName="Helvetica-Bold", fontSize=26, spaceAfter=14))
+_STYLES.add(ParagraphStyle(name="H2", parent=_STYLES["Heading2"], fontName="Helvetica-Bold", fontSize=14, spaceAfter=10))
+_STYLES.add(ParagraphStyle(name="Body", parent=_STYLES["BodyText"], fontName="Helvetica", fontSize=10, leading=14))
+# Body text split into separate paragraphs; the gap matches a <br/><br/> break
+_STYLES.add(ParagraphStyle(name="BodySpaced", parent=_STYLES["Body"], spaceAfter=14))
+# List items sit on consecutive lines, like the old <br/>-separated bullets
+_STYLES.add(ParagraphStyle(name="BodyItem", parent=_STYLES["Body"], spaceBefore=0))
+
+# Table copies row data into its own lists, so row constants can be tuples
+_CONTENTS_ROWS = (
+    ("Summary", "3"),
+    ("Information to Support NCSC Early Warning", "4"),
+    ("High-Level Report Findings", "5"),
+    ("Aim and Importance", "9"),
+    ("Considerations", "16"),
+)
+
+_CONTENTS_COLWIDTHS = (120 * mm, 30 * mm)
+
+_HL_HEADER_ROW = ("#", "Test", "Result", "Headline", "Summary")
+_HL_COLWIDTHS = (
+    10 * mm,  # #
+    40 * mm,  # Test
+    18 * mm,  # Result
+    28 * mm,  # Headline
+    64 * mm,  # Summary
+)
+
+_CONTENTS_STYLE = TableStyle(
+    [
+        ("FONT", (0, 0), (-1, -1), "Helvetica", 10),
+        ("LINEBELOW", (0, 0), (-1, 0), 1, colors.black),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.white]),
+        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
+
+_HL_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 10, 14),
+
+        # Short cells are plain strings drawn in the Body font; Result is bold
+        # and coloured per row (see generate_pdf_to_stream)
+        ("FONT", (0, 1), (-1, -1), "Helvetica", 10, 14),
+        ("FONT", (2, 1), (2, -1), "Helvetica-Bold", 10, 14),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (0, -1), "CENTER"),  # #
+        ("ALIGN", (2, 1), (2, -1), "CENTER"),  # Result
+
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FAFAFA")]),
+    ]
+)
+
+
+# -----------------------------
+# Static report text (parsed once at import)
+# -----------------------------
+class _StaticParagraph(Paragraph):
+    """
+    Paragraph for fixed text that every report shares through shallow copies.
+
+    Line breaking depends only on the text, style and width, so the first
+    layout at each width is kept and reused by all copies; drawing only reads
+    it. split() may adjust the line data it works from, so it re-breaks the
+    lines privately first.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._layouts: Dict[float, Tuple[float, float, Any, List[float]]] = {}
+
+    def wrap(self, availWidth, availHeight):
+        layout = self._layouts.get(availWidth)
+        if layout is None:
+            size = super().wrap(availWidth, availHeight)
+            if "blPara" in self.__dict__:  # not set when the width is too narrow to lay out
+                self._layouts[availWidth] = (self.width, self.height, self.blPara, self._wrapWidths)
+            return size
+        self.width, self.height, self.blPara, self._wrapWidths = layout
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        Paragraph.wrap(self, availWidth, availHeight)
+        return super().split(availWidth, availHeight)
+
+
+# Only the three inputs are substituted per report
+_SUMMARY_TMPL = (
+    "A cyber security health check has been carried out and this report shows the associated findings.<br/><br/>"
+    "<b>Business name:</b> {business_name}<br/>"
+    "<b>Email:</b> {email}<br/>"
+    "<b>Website:</b> {website}<br/><br/>"
+    "Tests included in this generated report (based on the provided data files):<br/><br/>"
+    "1. Email compromise (HaveIBeenPwned extract)<br/>"
+    "2. Website TLS posture (SSL Labs extract)<br/>"
+)
+
+# Builds use a shallow copy: the parsed text is shared, while the layout state
+# ReportLab sets during wrap/split stays per document.
+_NCSC_HTML = (
+    "The National Cyber Security Centre (NCSC) is the UK's technical authority on cyber security, "
+    "dedicated to making the UK the safest place to live and work online. The NCSC provides a range "
+    "of services to help organisations protect themselves and react to cyber threats. One of their "
+    "key offerings is called ‘Early Warning’ and is aimed to provide notification about potential "
+    "cyber security related threats such as malicious activity.<br/><br/>"
+
+    "The NCSC have a mission to make the UK the safest place to work online, and as such they have "
+    "made the Early Warning Service available to any sized organisation based in the UK. This "
+    "includes public sector bodies, private companies of all sizes, charities and not for profits, "
+    "educational institutes, healthcare providers and local authorities. There are thousands of "
+    "organisations already signed up, but many thousands more that can sign-up.<br/><br/>"
+
+    "<b>How it Works:</b><br/><br/>"
+    "• Timely Alerts: Provides notifications about potential cyber threats as soon as they’re "
+    "detected by the NCSC. This (early warning) can give more opportunity to fix, before the "
+    "situation gets worse<br/><br/>"
+    "• Reduced Risk: By receiving alerts about vulnerabilities and malicious activities, "
+    "organisations can strengthen security controls and reduce the risk of a data breach<br/><br/>"
+    "• Free and Easy to Use: It’s a free service, that just requires sign-up. It’s also very easy "
+    "to setup and use<br/><br/>"
+    "• Effective Communication: Having a point of contact aligned with the services, means the "
+    "(early warning) alerts will be sent to the correct person, who can take action.<br/><br/>"
+    "• Adds to Existing Security Controls: The Early Warning service can enhance and supplement "
+    "the effectiveness of cyber security, by providing an additional layer of monitoring and "
+    "alerting<br/><br/>"
+    "• Compliance Support: By helping organisations identify and address vulnerabilities, the "
+    "service supports compliance with UK data protection regulations and other legal requirements<br/><br/>"
+
+    "<b>To setup NCSC Early Warning for your organisation:</b><br/><br/>"
+    "1. Create a MyNCSC Account: Organisations need to first create a MyNCSC account (unless "
+    "already holding one). This can be done by visiting the NCSC website and following the "
+    "registration instructions<br/><br/>"
+    "2. Register for the Service: For the registration process, organisations provide their name "
+    "and/or company number. This is then reviewed and approved by the NCSC.<br/><br/>"
+    "3. Reference Assets: Once registered, organisations can setup their assets (domain names and "
+    "IP addresses) within the MyNCSC Early Warning system. Asset can also be detected automatically, "
+    "based on the information provided. Members and points of contact can also be setup<br/><br/>"
+    "4. Review and Act on Alerts: After setting up the service, organisations will start receiving "
+    "alerts about potential threats – this can be received via email and through the MyNCSC portal. "
+    "It’s important to review these alerts promptly and take appropriate actions to mitigate any "
+    "identified risks."
+)
+_NCSC_PARA = _StaticParagraph(_NCSC_HTML, _STYLES["Body"])
+
+
+_AIM_HTML_INTRO = (
+    "The aim of the health check is to raise awareness of the cyber security related risks and to "
+    "help consider whether action should be taken.<br/><br/>"
+
+    "For each test the following criteria has been expanded on to support understanding, importance "
+    "and decision making:<br/><br/>"
+
+    "• Impact – what a potential failed test might lead to.<br/><br/>"
+    "• Example – more specific cyberattack technique that could be faced and/or example of financial impact.<br/><br/>"
+    "• Data privacy and protection – reference to United Kingdom and European Union General Data Protection Regulations "
+    "(UK and EU GDPR) and California Consumer Privacy Act (CCPA).<br/><br/>"
+    "• Potential Resolution – action that may be considered to reduce the risk.<br/><br/>"
+    "• Resolution risk – impact that may need to be considered as a result of implementing action to reduce the risk.<br/><br/>"
+    "• To pass our test – criteria that we have set to pass the test.<br/><br/>"
+    "• Key metric / perspective – insight on how wide-spread the risk may be.<br/><br/>"
+)
+
+@dataclass(frozen=True, slots=True)
+class _TestSpec:
+    number: int
+    title: str
+    impact: str
+    example: str
+    resolution: str
+    resolution_risk: str
+    pass_criteria: str
+    metric: str
+    # Labels as worded in the original copy; a few tests differ from the rest
+    impact_label: str = "Potential Impact –"
+    pass_label: str = "To pass our test –"
+
+
+def _render_test(t: _TestSpec) -> str:
+    return (
+        f"<b>{t.number}. {t.title}</b><br/><br/>"
+        f"• {t.impact_label} {t.impact}<br/><br/>"
+        f"• Example – {t.example}<br/><br/>"
+        "• Data privacy and protection – potential for unauthorised access to personal data and therefore "
+        "non-compliance with UK GDPR, EU GDPR and CCPA.<br/><br/>"
+        f"• Potential resolution – {t.resolution}<br/><br/>"
+        f"• Resolution risk – {t.resolution_risk}<br/><br/>"
+        f"• {t.pass_label} {t.pass_criteria}<br/><br/>"
+        f"• Key metric / perspective – {t.metric}<br/><br/>"
+    )
+
+
+# The tests described in Aim and Importance, in report order
+_TESTS = (
+    _TestSpec(
+        number=1,
+        title="Account compromise",
+        impact="your account password may be known and/or your email / data may be accessible to others.",
+        example=(
+            "‘credential stuffing’ is a technique used by bad actors, where password / username combinations are "
+            "tried on multiple websites, data breaches often involve this type of attack."
+        ),
+        resolution=(
+            "change password (wherever it is used), use unique / strong passwords, enable multi-factor "
+            "authentication (MFA), change answers to any security questions."
+        ),
+        resolution_risk=(
+            "new password may be forgotten and/or MFA may not be strong enough (consider using a password manager "
+            "and Google / Microsoft authenticator)."
+        ),
+        pass_criteria=(
+            "your email address must not show in a list of known compromised accounts from a dark web search."
+        ),
+        metric="Over 14 billion email accounts appear in this test based on our (external) 2024 data source.",
+        impact_label="Impact -",
+        pass_label="To pass our test -",
+    ),
+    _TestSpec(
+        number=2,
+        title="Email anti-spoofing protection",
+        impact="other people may be sending email that appears to be from you.",
+        example=(
+            "‘spoofing’ is a technique used by bad actors, where emails are sent that impersonate company "
+            "employees, financial implications can often be experienced from this type of attack."
+        ),
+        resolution="review and update configuration settings on your DNS and email platforms.",
+        resolution_risk="failed email delivery due to strict policy enforcement changes.",
+        pass_criteria=(
+            "your email platform must have a strong Domain Based Message Authentication Reporting and Conformance "
+            "(DMARC) policy in place (set to quarantine or reject) and no errors in Sender Policy Framework (SPF) "
+            "settings."
+        ),
+        metric="Approximately 45% of domains should pass this test based on our (external) 2024 data source.",
+        impact_label="Impact –",
+    ),
+    _TestSpec(
+        number=3,
+        title="Email encryption (privacy)",
+        impact="other people may be reading the emails that you send and receive.",
+        example=(
+            "‘man-in the-middle’ attack is a technique used by bad actors, where they read and potentially alter "
+            "communications."
+        ),
+        resolution="review and update configuration settings on your email platform.",
+        resolution_risk="failed email delivery due to compatibility and/or configuration.",
+        pass_criteria=(
+            "an up-to-date version of Transport Layer Security (TLS) must be detected on your email platform."
+        ),
+        metric="Approximately 85% of email domains should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=4,
+        title="Email encryption downgrade (privacy)",
+        impact="other people may be reading the emails that you send and receive.",
+        example=(
+            "‘man-in-the-middle’ attack is a technique used by bad actors, where they read and potentially alter "
+            "communications."
+        ),
+        resolution="review and update configuration settings on your email hosting platform.",
+        resolution_risk="failed email delivery due to compatibility and/or configuration.",
+        pass_criteria=(
+            "Your email platform must have Mail Transfer Agent-Strict Transport Security (MTA-SPS) settings "
+            "applied to enforce mode and no errors."
+        ),
+        metric="Approximately 1% of domains should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=5,
+        title="Public IP address vulnerability",
+        impact="systems weaknesses could be exploited, leading to data compromise.",
+        example=(
+            "‘exploitation’ attack is a technique used by bad actors, to scan and detect known vulnerabilities, "
+            "then exploit weakness"
+        ),
+        resolution=(
+            "review, remove and/or block access to known weaknesses that are associated with your public IP "
+            "address."
+        ),
+        resolution_risk=(
+            "service disruption, misconfiguration and compatibility issues on hosts that have been changed."
+        ),
+        pass_criteria="no vulnerabilities must be detected on your public IP address.",
+        metric=(
+            "Approximately 80% of public IP addresses should pass this test based on our (external) 2023 data "
+            "source."
+        ),
+    ),
+    _TestSpec(
+        number=6,
+        title="Website malicious software",
+        impact="your website may be infected with malicious software.",
+        example=(
+            "‘drive by downloads’ are a type of attack used by bad actors, whereby user devices are infected "
+            "simply by visiting the site."
+        ),
+        resolution="isolate, clean, recover and secure your web server.",
+        resolution_risk="service disruption, misconfiguration and compatibility issues on website due to change",
+        pass_criteria="your website must not have malware detected by scanners.",
+        metric="Approximately 93% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=7,
+        title="Website blacklisting",
+        impact="your website may be infected with malicious software.",
+        example="‘website blacklisting’ can lead to websites being blocked by search engines and security tools.",
+        resolution="isolate, clean, recover and secure your web server and request removal from blacklist.",
+        resolution_risk="service disruption, misconfiguration and compatibility issues on website due to change.",
+        pass_criteria="your website must not appear on a blacklist site lists.",
+        metric="Approximately 99% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=8,
+        title="Website encryption",
+        impact="communication to / from your website may be read by others.",
+        example="‘man-in-the-middle’ attacks can take place on websites without strong encryption.",
+        resolution="ensure your website has strong encryption in place.",
+        resolution_risk="service disruption, misconfiguration and compatibility issues on website due to change.",
+        pass_criteria="your website must be identified to use TLS 1.2 or above and must not support weak encryption.",
+        metric="Approximately 97% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=9,
+        title="Website privacy notice",
+        impact="you may not be informing website visitors that their personal data is being collected.",
+        example="Google (2019) and Facebook (2018) have both experienced heavy fines.",
+        resolution="ensure your website has an appropriate privacy policy.",
+        resolution_risk="legal considerations for content of notice.",
+        pass_criteria="your website must have a clear option to enable viewing of a privacy notice.",
+        metric="Approximately 36% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=10,
+        title="Website cookies notice",
+        impact="you may be collecting data from website visitors without their consent.",
+        example="Sephora (2022) were fined around $1.2m in relation to cookies.",
+        resolution="ensure your website has an appropriate cookies policy.",
+        resolution_risk="challenges with technical review of cookies and legal considerations for content of notice.",
+        pass_criteria="your website must have a clear option to enable viewing of a dedicated cookies notice.",
+        metric="Approximately 36% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=11,
+        title="Website cookies rejection (before usage)",
+        impact="you may be collecting data from website visitors without their consent.",
+        example="Google (2021) were fined around $150m for not providing a straight forward way to reject cookies.",
+        resolution="ensure your website has an appropriate banner or button to reject non-essential cookies",
+        resolution_risk="challenges with implementation, reduced analytics and change in user experience.",
+        pass_criteria=(
+            "when first visiting your website, there must be a clear banner or button to reject non-essential "
+            "cookies."
+        ),
+        metric="Approximately 50% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=12,
+        title="Website cookies rejection (after initial consent)",
+        impact="you may be collecting data from website visitors without their consent.",
+        example="TikTok (2023) were fined around $5m for making it difficult for users to refuse cookies.",
+        resolution="ensure your website has an appropriate banner or button to reject non-essential cookies.",
+        resolution_risk="challenges with implementation, reduced analytics and change in user experience.",
+        pass_criteria=(
+            "when returning to your website, there must be a clear banner or button to reject non-essential "
+            "cookies."
+        ),
+        metric="Approximately 60% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=13,
+        title="Website web application firewall",
+        impact="your website may be susceptible to attack and/or compromise.",
+        example="SQL injection and remote code execution attacks.",
+        resolution="ensure your website is protected by a web application firewall.",
+        resolution_risk="impact to website performance, configuration complexity and cost.",
+        pass_criteria="your website must indicate a web application firewall is in place during testing.",
+        metric="Approximately 70% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=14,
+        title="Website security headers",
+        impact="your website may be susceptible to attack and/or compromise.",
+        example="credit card skimming attacks.",
+        resolution="ensure your website has protections to prevent exploitation.",
+        resolution_risk="configuration complexity and cost.",
+        pass_criteria="your website must be rated as having ‘grade C’ level hardening or above.",
+        metric="Approximately 14% of websites should pass this test based on our (external) 2024 data source.",
+    ),
+    _TestSpec(
+        number=15,
+        title="Information Commissioners Office (ICO) register of data protection fee payers",
+        impact="your organisation may not be exempt from fees and could be subject to financial charges",
+        example="nonpayment can result in fines of up to £4,000.",
+        resolution="check and pay the ICO annual fee.",
+        resolution_risk="cost to implement.",
+        pass_criteria="your business name must be visible via the register of data protection fee payers.",
+        metric="Approximately 80% of business should pass this test based on our (external) 2024 data source.",
+    ),
+)
+
+_TESTS_HTML = tuple(_render_test(t) for t in _TESTS)
+
+_AIM_HTML = "".join((_AIM_HTML_INTRO,) + _TESTS_HTML)
+
+_CONSIDERATIONS_ITEMS = (
+    "Check whether it’s a false positive (incorrect report of a failure)",
+    "Carry out further research and testing",
+    "Check your legal and regulatory obligations",
+    "Seek professional advice and support",
+    "Carry out a risk assessment and manage the risk",
+    "Manage and report a security incident",
+)
+
+
+# One Paragraph per item keeps each wrap short instead of laying out the whole
+# section as a single multi-page paragraph
+_AIM_PARTS = tuple(part for part in _AIM_HTML.split("<br/><br/>") if part)
+
+# Everything after the detailed findings is fixed text
+_STATIC_POST_STORY = (
+    _StaticParagraph("Aim and Importance", _STYLES["H2"]),
+    *(_StaticParagraph(part, _STYLES["BodySpaced"]) for part in _AIM_PARTS),
+    PageBreak(),
+    _StaticParagraph("Considerations", _STYLES["H2"]),
+    _StaticParagraph("<b>If any of the above test have failed – you may need to:</b>", _STYLES["BodySpaced"]),
+)
+
+_CONSIDERATIONS_PARAS = tuple(_StaticParagraph(item, _STYLES["BodyItem"]) for item in _CONSIDERATIONS_ITEMS)
+
+
+def _considerations_list() -> ListFlowable:
+    # Built per report: the list keeps layout state on itself, so only the
+    # (copied) item paragraphs are shared between builds
+    return ListFlowable(
+        [ListItem(copy.copy(p)) for p in _CONSIDERATIONS_PARAS],
+        bulletType="bullet",
+        start="•",
+        bulletFontSize=_STYLES["Body"].fontSize,
+        leftIndent=12,
+    )
+
+
+# -----------------------------
+# Detailed finding pages
+# -----------------------------
+_DETAIL_COLWIDTHS = (45 * mm, 105 * mm)  # Metric, Value
+
+
+def _finding_flowables(f: Finding) -> List[Any]:
+    body = _STYLES["Body"]
+    return [
+        Paragraph(f"{f.number}. {f.title}", _STYLES["H2"]),
+        Paragraph(
+            f"<b>Result:</b> <font color='{f.status_hex}'>{f.status}</font> &nbsp;&nbsp;"
+            f"<b>{f.headline}</b>",
+            body,
+        ),
+        Spacer(1, 4 * mm),
+        Paragraph(f.summary, body),
+        Spacer(1, 6 * mm),
+        _DetailTable(f.details, col_widths=_DETAIL_COLWIDTHS),
+        PageBreak(),
+    ]
 
 
 # -----------------------------
 # PDF generator
 # -----------------------------
+@lru_cache(maxsize=4)
+def _today_str(ordinal: int) -> str:
+    # Keyed on the day, so batch runs format the default review date once per day
+    return date.fromordinal(ordinal).strftime("%d/%m/%Y")
+
+
 def generate_pdf_bytes(
     business_name: str,
     email: str,
@@ -269,443 +1080,214 @@ def generate_pdf_bytes(
     ssl: Dict[str, Any],
     classification: str = "Confidential",
     last_reviewed: Optional[str] = None,
-    logo_path: Optional[str] = None,
+    logo_path: Union[str, BinaryIO, None] = None,
+    compress: bool = True,
 ) -> bytes:
-    last_reviewed = last_reviewed or date.today().strftime("%d/%m/%Y")
-    report_title = f"Cyber Health Check Report {business_name}"
-    findings = build_findings(hibp, ssl)
-
     buf = io.BytesIO()
-    doc = SimpleDocTemplate(
+    generate_pdf_to_stream(
         buf,
-        pagesize=A4,
-        leftMargin=20 * mm,
-        rightMargin=20 * mm,
-        topMargin=28 * mm,
-        bottomMargin=18 * mm,
-        title=report_title,
+        business_name=business_name,
+        email=email,
+        website=website,
+        hibp=hibp,
+        ssl=ssl,
+        classification=classification,
+        last_reviewed=last_reviewed,
+        logo_path=logo_path,
+        compress=compress,
     )
+    return buf.getvalue()
 
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="H1", parent=styles["Heading1"], fontName="Helvetica-Bold", fontSize=26, spaceAfter=14))
-    styles.add(ParagraphStyle(name="H2", parent=styles["Heading2"], fontName="Helvetica-Bold", fontSize=14, spaceAfter=10))
-    styles.add(ParagraphStyle(name="Body", parent=styles["BodyText"], fontName="Helvetica", fontSize=10, leading=14))
-
-    story: List[Any] = []
-
-    # Cover
-    story.append(Spacer(1, 25 * mm))
-    story.append(Paragraph("Cyber Health Check Report", styles["H1"]))
-    story.append(Paragraph(business_name, styles["H1"]))
-    story.append(PageBreak())
-
-    # Contents
-    story.append(Paragraph("Document Contents Page", styles["H2"]))
-    contents_data = [
-        ["Summary", "3"],
-        ["Information to Support NCSC Early Warning", "4"],
-        ["High-Level Report Findings", "5"],
-        ["Aim and Importance", "9"],
-        ["Considerations", "16"],
-    ]
-    t = Table(contents_data, colWidths=[120 * mm, 30 * mm])
-    t.setStyle(
-        TableStyle(
-            [
-                ("FONT", (0, 0), (-1, -1), "Helvetica", 10),
-                ("LINEBELOW", (0, 0), (-1, 0), 1, colors.black),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.white]),
-                ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-            ]
-        )
-    )
-    story.append(t)
-    story.append(PageBreak())
-
-    # Summary
-    story.append(Paragraph("Summary", styles["H2"]))
-    story.append(
-        Paragraph(
-            "A cyber security health check has been carried out and this report shows the associated findings.<br/><br/>"
-            f"<b>Business name:</b> {business_name}<br/>"
-            f"<b>Email:</b> {email}<br/>"
-            f"<b>Website:</b> {website}<br/><br/>"
-            "Tests included in this generated report (based on the provided data files):<br/><br/>"
-            "1. Email compromise (HaveIBeenPwned extract)<br/>"
-            "2. Website TLS posture (SSL Labs extract)<br/>",
-            styles["Body"],
-        )
-    )
-    story.append(PageBreak())
 
-    # -------------------------------------------------------
-    # Information to Support NCSC Early Warning 
-    # -------------------------------------------------------
-    story.append(Paragraph("Information to Support NCSC Early Warning", styles["H2"]))
-    story.append(
-        Paragraph(
-            "The National Cyber Security Centre (NCSC) is the UK's technical authority on cyber security, "
-            "dedicated to making the UK the safest place to live and work online. The NCSC provides a range "
-            "of services to help organisations protect themselves and react to cyber threats. One of their "
-            "key offerings is called ‘Early Warning’ and is aimed to provide notification about potential "
-            "cyber security related threats such as malicious activity.<br/><br/>"
-
-            "The NCSC have a mission to make the UK the safest place to work online, and as such they have "
-            "made the Early Warning Service available to any sized organisation based in the UK. This "
-            "includes public sector bodies, private companies of all sizes, charities and not for profits, "
-            "educational institutes, healthcare providers and local authorities. There are thousands of "
-            "organisations already signed up, but many thousands more that can sign-up.<br/><br/>"
-
-            "<b>How it Works:</b><br/><br/>"
-            "• Timely Alerts: Provides notifications about potential cyber threats as soon as they’re "
-            "detected by the NCSC. This (early warning) can give more opportunity to fix, before the "
-            "situation gets worse<br/><br/>"
-            "• Reduced Risk: By receiving alerts about vulnerabilities and malicious activities, "
-            "organisations can strengthen security controls and reduce the risk of a data breach<br/><br/>"
-            "• Free and Easy to Use: It’s a free service, that just requires sign-up. It’s also very easy "
-            "to setup and use<br/><br/>"
-            "• Effective Communication: Having a point of contact aligned with the services, means the "
-            "(early warning) alerts will be sent to the correct person, who can take action.<br/><br/>"
-            "• Adds to Existing Security Controls: The Early Warning service can enhance and supplement "
-            "the effectiveness of cyber security, by providing an additional layer of monitoring and "
-            "alerting<br/><br/>"
-            "• Compliance Support: By helping organisations identify and address vulnerabilities, the "
-            "service supports compliance with UK data protection regulations and other legal requirements<br/><br/>"
-
-            "<b>To setup NCSC Early Warning for your organisation:</b><br/><br/>"
-            "1. Create a MyNCSC Account: Organisations need to first create a MyNCSC account (unless "
-            "already holding one). This can be done by visiting the NCSC website and following the "
-            "registration instructions<br/><br/>"
-            "2. Register for the Service: For the registration process, organisations provide their name "
-            "and/or company number. This is then reviewed and approved by the NCSC.<br/><br/>"
-            "3. Reference Assets: Once registered, organisations can setup their assets (domain names and "
-            "IP addresses) within the MyNCSC Early Warning system. Asset can also be detected automatically, "
-            "based on the information provided. Members and points of contact can also be setup<br/><br/>"
-            "4. Review and Act on Alerts: After setting up the service, organisations will start receiving "
-            "alerts about potential threats – this can be received via email and through the MyNCSC portal. "
-            "It’s important to review these alerts promptly and take appropriate actions to mitigate any "
-            "identified risks.",
-            styles["Body"],
-        )
-    )
-    story.append(PageBreak())
+_PDF_CACHE_SIZE = 64
+_pdf_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_pdf_cache_lock = threading.Lock()
 
-    # -------------------------------------------------------
-    # High-Level Findings (FIXED: wrapped text + alignment)
-    # -------------------------------------------------------
-    story.append(Paragraph("High-Level Report Findings", styles["H2"]))
-
-    hl_rows = [
-        [
-            Paragraph("<b>#</b>", styles["Body"]),
-            Paragraph("<b>Test</b>", styles["Body"]),
-            Paragraph("<b>Result</b>", styles["Body"]),
-            Paragraph("<b>Headline</b>", styles["Body"]),
-            Paragraph("<b>Summary</b>", styles["Body"]),
-        ]
-    ]
 
-    for f in findings:
-        hl_rows.append(
-            [
-                Paragraph(str(f.number), styles["Body"]),
-                Paragraph(f.title, styles["Body"]),
-                Paragraph(
-                    f"<font color='{_status_color(f.status).hexval()}'><b>{f.status}</b></font>",
-                    styles["Body"],
-                ),
-                Paragraph(f.headline, styles["Body"]),
-                Paragraph(f.summary, styles["Body"]),
-            ]
-        )
+def generate_pdf_cached(
+    business_name: str,
+    email: str,
+    website: str,
+    hibp: Dict[str, Any],
+    ssl: Dict[str, Any],
+    classification: str = "Confidential",
+    last_reviewed: Optional[str] = None,
+    logo_path: Optional[str] = None,
+    compress: bool = True,
+) -> bytes:
+    """
+    Same as generate_pdf_bytes, but keeps the last _PDF_CACHE_SIZE reports in
+    memory so re-rendering identical inputs (retries, re-downloads) skips
+    ReportLab entirely.
 
-    hl = Table(
-        hl_rows,
-        colWidths=[
-            10 * mm,  # #
-            40 * mm,  # Test
-            18 * mm,  # Result
-            28 * mm,  # Headline
-            64 * mm,  # Summary
-        ],
-        repeatRows=1,
+    Only logos given by path are cached; for in-memory logos use
+    generate_pdf_bytes.
+    """
+    last_reviewed = last_reviewed or _today_str(date.today().toordinal())
+    key = hashlib.blake2b(
+        _dumps_sorted([business_name, email, website, hibp, ssl, classification, last_reviewed, logo_path, compress]),
+        digest_size=16,
+    ).hexdigest()
+
+    with _pdf_cache_lock:
+        pdf = _pdf_cache.get(key)
+        if pdf is not None:
+            _pdf_cache.move_to_end(key)
+            return pdf
+
+    # Built outside the lock so concurrent misses for different reports don't queue
+    pdf = generate_pdf_bytes(
+        business_name=business_name,
+        email=email,
+        website=website,
+        hibp=hibp,
+        ssl=ssl,
+        classification=classification,
+        last_reviewed=last_reviewed,
+        logo_path=logo_path,
+        compress=compress,
     )
 
-    hl.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
-                ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 10),
+    with _pdf_cache_lock:
+        _pdf_cache[key] = pdf
+        _pdf_cache.move_to_end(key)
+        while len(_pdf_cache) > _PDF_CACHE_SIZE:
+            _pdf_cache.popitem(last=False)
+    return pdf
 
-                ("FONT", (0, 1), (-1, -1), "Helvetica", 9),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
 
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("ALIGN", (0, 0), (0, -1), "CENTER"),  # #
-                ("ALIGN", (2, 1), (2, -1), "CENTER"),  # Result
+def generate_pdf_to_stream(
+    stream: BinaryIO,
+    business_name: str,
+    email: str,
+    website: str,
+    hibp: Dict[str, Any],
+    ssl: Dict[str, Any],
+    classification: str = "Confidential",
+    last_reviewed: Optional[str] = None,
+    logo_path: Union[str, BinaryIO, None] = None,
+    compress: bool = True,
+) -> None:
+    """
+    Writes the report into an open binary file-like (file, HTTP response, ...)
+    instead of returning bytes.
 
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+    logo_path may also be an in-memory image file such as an uploaded logo.
 
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FAFAFA")]),
-            ]
-        )
+    compress=False skips zlib on the page streams (faster, ~60% larger file);
+    useful when the output is compressed again downstream.
+    """
+    last_reviewed = last_reviewed or _today_str(date.today().toordinal())
+    report_title = f"Cyber Health Check Report {business_name}"
+    findings = build_findings(hibp, ssl)
+
+    # Decode the logo once; the header callback draws it on every page
+    logo = None
+    if logo_path:
+        try:
+            logo = _load_logo(logo_path)
+        except Exception:
+            pass
+
+    doc = SimpleDocTemplate(
+        stream,
+        pagesize=A4,
+        leftMargin=_LEFT_M,
+        rightMargin=_RIGHT_M,
+        topMargin=_TOP_M,
+        bottomMargin=_BOT_M,
+        title=report_title,
+        pageCompression=1 if compress else 0,
     )
 
-    story.append(hl)
-    story.append(PageBreak())
+    styles = _STYLES
+    body = styles["Body"]
 
+    contents = Table(_CONTENTS_ROWS, colWidths=_CONTENTS_COLWIDTHS)
+    contents.setStyle(_CONTENTS_STYLE)
 
+    # High-Level Findings (FIXED: wrapped text + alignment)
+    # Only the columns that wrap need Paragraphs
+    hl_rows = [_HL_HEADER_ROW] + [
+        (f.number, Paragraph(f.title, body), f.status, f.headline, Paragraph(f.summary, body))
+        for f in findings
+    ]
+
+    hl = Table(hl_rows, colWidths=_HL_COLWIDTHS, repeatRows=1)
+    hl.setStyle(_HL_STYLE)
+    hl.setStyle([("TEXTCOLOR", (2, i), (2, i), _status_color(f.status)) for i, f in enumerate(findings, 1)])
+
+    story: List[Any] = [
+        # Cover is drawn by on_first_page; just move the flowables past it
+        PageBreak(),
+
+        # Contents
+        Paragraph("Document Contents Page", styles["H2"]),
+        contents,
+        PageBreak(),
+
+        # Summary
+        Paragraph("Summary", styles["H2"]),
+        Paragraph(_SUMMARY_TMPL.format(business_name=business_name, email=email, website=website), body),
+        PageBreak(),
+
+        # Information to Support NCSC Early Warning
+        Paragraph("Information to Support NCSC Early Warning", styles["H2"]),
+        copy.copy(_NCSC_PARA),
+        PageBreak(),
+
+        # High-Level Findings
+        Paragraph("High-Level Report Findings", styles["H2"]),
+        hl,
+        PageBreak(),
+    ]
 
     # Detailed Findings
     for f in findings:
-        story.append(Paragraph(f"{f.number}. {f.title}", styles["H2"]))
-        story.append(
-            Paragraph(
-                f"<b>Result:</b> <font color='{_status_color(f.status).hexval()}'>{f.status}</font> &nbsp;&nbsp;"
-                f"<b>{f.headline}</b>",
-                styles["Body"],
-            )
-        )
-        story.append(Spacer(1, 4 * mm))
-        story.append(Paragraph(f.summary, styles["Body"]))
-        story.append(Spacer(1, 6 * mm))
-
-        detail_table = Table(
-            [["Metric", "Value"]] + [[k, v] for (k, v) in f.details],
-            colWidths=[45 * mm, 105 * mm],
-        )
-        detail_table.setStyle(
-            TableStyle(
-                [
-                    ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 10),
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#EEEEEE")),
-                    ("FONT", (0, 1), (-1, -1), "Helvetica", 9),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("TOPPADDING", (0, 0), (-1, -1), 6),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ]
-            )
-        )
-        story.append(KeepTogether(detail_table))
-        story.append(PageBreak())
-    # -------------------------------------------------------
-    # Aim and Importance
-    # -------------------------------------------------------
-    story.append(Paragraph("Aim and Importance", styles["H2"]))
-    story.append(
-        Paragraph(
-            "The aim of the health check is to raise awareness of the cyber security related risks and to "
-            "help consider whether action should be taken.<br/><br/>"
-
-            "For each test the following criteria has been expanded on to support understanding, importance "
-            "and decision making:<br/><br/>"
-            
-            "• Impact – what a potential failed test might lead to.<br/><br/>"
-            "• Example – more specific cyberattack technique that could be faced and/or example of financial impact.<br/><br/>"
-            "• Data privacy and protection – reference to United Kingdom and European Union General Data Protection Regulations "
-            "(UK and EU GDPR) and California Consumer Privacy Act (CCPA).<br/><br/>"
-            "• Potential Resolution – action that may be considered to reduce the risk.<br/><br/>"
-            "• Resolution risk – impact that may need to be considered as a result of implementing action to reduce the risk.<br/><br/>"
-            "• To pass our test – criteria that we have set to pass the test.<br/><br/>"
-            "• Key metric / perspective – insight on how wide-spread the risk may be.<br/><br/>"
-
-            "<b>1. Account compromise</b><br/><br/>"
-            
-            "• Impact - your account password may be known and/or your email / data may be accessible to others.<br/><br/>"
-            "• Example – ‘credential stuffing’ is a technique used by bad actors, where password / username combinations are tried "
-            "on multiple websites, data breaches often involve this type of attack.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – change password (wherever it is used), use unique / strong passwords, enable "
-            "multi-factor authentication (MFA), change answers to any security questions.<br/><br/>"
-            "• Resolution risk – new password may be forgotten and/or MFA may not be strong enough (consider using a password "
-            "manager and Google / Microsoft authenticator).<br/><br/>"
-            "• To pass our test - your email address must not show in a list of known compromised accounts from a dark web search.<br/><br/>"
-            "• Key metric / perspective – Over 14 billion email accounts appear in this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>2. Email anti-spoofing protection</b><br/><br/>"
-            
-            "• Impact – other people may be sending email that appears to be from you.<br/><br/>"
-            "• Example – ‘spoofing’ is a technique used by bad actors, where emails are sent that impersonate company employees, "
-            "financial implications can often be experienced from this type of attack.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – review and update configuration settings on your DNS and email platforms.<br/><br/>"
-            "• Resolution risk – failed email delivery due to strict policy enforcement changes.<br/><br/>"
-            "• To pass our test – your email platform must have a strong Domain Based Message Authentication Reporting and "
-            "Conformance (DMARC) policy in place (set to quarantine or reject) and no errors in Sender Policy Framework (SPF) settings.<br/><br/>"
-            "• Key metric / perspective – Approximately 45% of domains should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>3. Email encryption (privacy)</b><br/><br/>"
-            
-            "• Potential Impact – other people may be reading the emails that you send and receive.<br/><br/>"
-            "• Example – ‘man-in the-middle’ attack is a technique used by bad actors, where they read and potentially alter communications.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – review and update configuration settings on your email platform.<br/><br/>"
-            "• Resolution risk – failed email delivery due to compatibility and/or configuration.<br/><br/>"
-            "• To pass our test – an up-to-date version of Transport Layer Security (TLS) must be detected on your email platform.<br/><br/>"
-            "• Key metric / perspective – Approximately 85% of email domains should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>4. Email encryption downgrade (privacy)</b><br/><br/>"
-            
-            "• Potential Impact – other people may be reading the emails that you send and receive.<br/><br/>"
-            "• Example – ‘man-in-the-middle’ attack is a technique used by bad actors, where they read and potentially alter communications.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – review and update configuration settings on your email hosting platform.<br/><br/>"
-            "• Resolution risk – failed email delivery due to compatibility and/or configuration.<br/><br/>"
-            "• To pass our test – Your email platform must have Mail Transfer Agent-Strict Transport Security (MTA-SPS) settings "
-            "applied to enforce mode and no errors.<br/><br/>"
-            "• Key metric / perspective – Approximately 1% of domains should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>5. Public IP address vulnerability</b><br/><br/>"
-            "• Potential Impact – systems weaknesses could be exploited, leading to data compromise.<br/><br/>"
-            "• Example – ‘exploitation’ attack is a technique used by bad actors, to scan and detect known vulnerabilities, then exploit weakness<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – review, remove and/or block access to known weaknesses that are associated with your public IP address.<br/><br/>"
-            "• Resolution risk – service disruption, misconfiguration and compatibility issues on hosts that have been changed.<br/><br/>"
-            "• To pass our test – no vulnerabilities must be detected on your public IP address.<br/><br/>"
-            "• Key metric / perspective – Approximately 80% of public IP addresses should pass this test based on our (external) 2023 data source.<br/><br/>"
-
-            "<b>6. Website malicious software</b><br/><br/>"
-            "• Potential Impact – your website may be infected with malicious software.<br/><br/>"
-            "• Example – ‘drive by downloads’ are a type of attack used by bad actors, whereby user devices are infected simply by visiting the site.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – isolate, clean, recover and secure your web server.<br/><br/>"
-            "• Resolution risk – service disruption, misconfiguration and compatibility issues on website due to change<br/><br/>"
-            "• To pass our test – your website must not have malware detected by scanners.<br/><br/>"
-            "• Key metric / perspective – Approximately 93% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>7. Website blacklisting</b><br/><br/>"
-            "• Potential Impact – your website may be infected with malicious software.<br/><br/>"
-            "• Example – ‘website blacklisting’ can lead to websites being blocked by search engines and security tools.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – isolate, clean, recover and secure your web server and request removal from blacklist.<br/><br/>"
-            "• Resolution risk – service disruption, misconfiguration and compatibility issues on website due to change.<br/><br/>"
-            "• To pass our test – your website must not appear on a blacklist site lists.<br/><br/>"
-            "• Key metric / perspective – Approximately 99% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>8. Website encryption</b><br/><br/>"
-            "• Potential Impact – communication to / from your website may be read by others.<br/><br/>"
-            "• Example – ‘man-in-the-middle’ attacks can take place on websites without strong encryption.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – ensure your website has strong encryption in place.<br/><br/>"
-            "• Resolution risk – service disruption, misconfiguration and compatibility issues on website due to change.<br/><br/>"
-            "• To pass our test – your website must be identified to use TLS 1.2 or above and must not support weak encryption.<br/><br/>"
-            "• Key metric / perspective – Approximately 97% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>9. Website privacy notice</b><br/><br/>"
-            "• Potential Impact – you may not be informing website visitors that their personal data is being collected.<br/><br/>"
-            "• Example – Google (2019) and Facebook (2018) have both experienced heavy fines.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – ensure your website has an appropriate privacy policy.<br/><br/>"
-            "• Resolution risk – legal considerations for content of notice.<br/><br/>"
-            "• To pass our test – your website must have a clear option to enable viewing of a privacy notice.<br/><br/>"
-            "• Key metric / perspective – Approximately 36% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>10. Website cookies notice</b><br/><br/>"
-            "• Potential Impact – you may be collecting data from website visitors without their consent.<br/><br/>"
-            "• Example – Sephora (2022) were fined around $1.2m in relation to cookies.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – ensure your website has an appropriate cookies policy.<br/><br/>"
-            "• Resolution risk – challenges with technical review of cookies and legal considerations for content of notice.<br/><br/>"
-            "• To pass our test – your website must have a clear option to enable viewing of a dedicated cookies notice.<br/><br/>"
-            "• Key metric / perspective – Approximately 36% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>11. Website cookies rejection (before usage)</b><br/><br/>"
-            "• Potential Impact – you may be collecting data from website visitors without their consent.<br/><br/>"
-            "• Example – Google (2021) were fined around $150m for not providing a straight forward way to reject cookies.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – ensure your website has an appropriate banner or button to reject non-essential cookies<br/><br/>"
-            "• Resolution risk – challenges with implementation, reduced analytics and change in user experience.<br/><br/>"
-            "• To pass our test – when first visiting your website, there must be a clear banner or button to reject non-essential cookies.<br/><br/>"
-            "• Key metric / perspective – Approximately 50% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>12. Website cookies rejection (after initial consent)</b><br/><br/>"
-            "• Potential Impact – you may be collecting data from website visitors without their consent.<br/><br/>"
-            "• Example – TikTok (2023) were fined around $5m for making it difficult for users to refuse cookies.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – ensure your website has an appropriate banner or button to reject non-essential cookies.<br/><br/>"
-            "• Resolution risk – challenges with implementation, reduced analytics and change in user experience.<br/><br/>"
-            "• To pass our test – when returning to your website, there must be a clear banner or button to reject non-essential cookies.<br/><br/>"
-            "• Key metric / perspective – Approximately 60% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>13. Website web application firewall</b><br/><br/>"
-            "• Potential Impact – your website may be susceptible to attack and/or compromise.<br/><br/>"
-            "• Example – SQL injection and remote code execution attacks.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – ensure your website is protected by a web application firewall.<br/><br/>"
-            "• Resolution risk – impact to website performance, configuration complexity and cost.<br/><br/>"
-            "• To pass our test – your website must indicate a web application firewall is in place during testing.<br/><br/>"
-            "• Key metric / perspective – Approximately 70% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>14. Website security headers</b><br/><br/>"
-            "• Potential Impact – your website may be susceptible to attack and/or compromise.<br/><br/>"
-            "• Example – credit card skimming attacks.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – ensure your website has protections to prevent exploitation.<br/><br/>"
-            "• Resolution risk – configuration complexity and cost.<br/><br/>"
-            "• To pass our test – your website must be rated as having ‘grade C’ level hardening or above.<br/><br/>"
-            "• Key metric / perspective – Approximately 14% of websites should pass this test based on our (external) 2024 data source.<br/><br/>"
-
-            "<b>15. Information Commissioners Office (ICO) register of data protection fee payers</b><br/><br/>"
-            "• Potential Impact – your organisation may not be exempt from fees and could be subject to financial charges<br/><br/>"
-            "• Example – nonpayment can result in fines of up to £4,000.<br/><br/>"
-            "• Data privacy and protection – potential for unauthorised access to personal data and therefore non-compliance "
-            "with UK GDPR, EU GDPR and CCPA.<br/><br/>"
-            "• Potential resolution – check and pay the ICO annual fee.<br/><br/>"
-            "• Resolution risk – cost to implement.<br/><br/>"
-            "• To pass our test – your business name must be visible via the register of data protection fee payers.<br/><br/>"
-            "• Key metric / perspective – Approximately 80% of business should pass this test based on our (external) 2024 data source.<br/>",
-            styles["Body"],
-        )
-    )
-    story.append(PageBreak())
-    
-    # Considerations
-    story.append(Paragraph("Considerations", styles["H2"]))
-    story.append(
-        Paragraph(
-            " <b>If any of the above test have failed – you may need to:</b><br/><br/>"
-                "• Check whether it’s a false positive (incorrect report of a failure)<br/>"
-                "• Carry out further research and testing<br/>"
-                "• Check your legal and regulatory obligations<br/>"
-                "• Seek professional advice and support<br/>"
-                "• Carry out a risk assessment and manage the risk<br/>"
-                "• Manage and report a security incident<br/>",
-            styles["Body"],
-        )
+        story.extend(_finding_flowables(f))
+
+    # Aim and Importance, Considerations
+    story.extend(map(copy.copy, _STATIC_POST_STORY))
+    story.append(_considerations_list())
+
+    # Page callbacks (header/footer strings are formatted once, not per page)
+    on_page = _HeaderFooter(
+        report_title=report_title,
+        version_line=f"Version: 1.0  Classification: {classification}",
+        reviewed_line=f"Last Reviewed: {last_reviewed}",
+        logo=logo,
     )
 
-    # Page callbacks
-    def on_page(c: canvas.Canvas, d):
-        _draw_header_footer(
-            c=c,
-            doc=d,
-            report_title=report_title,
-            classification=classification,
-            last_reviewed=last_reviewed,
-            logo_path=logo_path,
-        )
+    def on_first_page(c: canvas.Canvas, d):
+        on_page(c, d)
+        _draw_cover(c, business_name)
 
-    doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
-    return buf.getvalue()
+    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_page)
+
+
+# -----------------------------
+# Batch generation
+# -----------------------------
+def _render_job(job: Dict[str, Any]) -> bytes:
+    return generate_pdf_bytes(**job)
+
+
+def generate_pdfs_batch(jobs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[bytes]:
+    """
+    Renders many reports across processes; ReportLab layout is pure Python, so
+    threads would just take turns on the GIL. Each job is a dict of
+    generate_pdf_bytes keyword arguments (logo_path should be a path, so jobs
+    pickle cheaply). Results come back in job order.
+
+    Reports are independent, so throughput scales with cores up to
+    min(len(jobs), max_workers or os.cpu_count()) workers. Each worker pays the
+    module import (styles, static paragraphs) once, then renders its share.
+    """
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    if workers < 2:
+        return [_render_job(job) for job in jobs]
+    # Several jobs per round-trip to the worker, while leaving ~4 chunks per
+    # worker so an unusually long report doesn't hold up the whole batch
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_render_job, jobs, chunksize=chunksize))
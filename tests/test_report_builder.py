@@ -0,0 +1,98 @@
+import math
+import unittest
+
+from report_builder import (
+    _DETAIL_COLWIDTHS,
+    _DetailTable,
+    _dumps_sorted,
+    _may_have_wide_int,
+    _strip_to_json,
+    generate_pdf_bytes,
+    load_json_from_text,
+)
+
+
+def _hibp_with_breaches(count):
+    return {
+        "email": "a@b.com",
+        "summary": {"breaches_found": count, "pastes_found": 0, "is_pwned": True},
+        "raw": {"breaches": [{"Name": f"Breach{i}"} for i in range(count)]},
+    }
+
+
+class DetailTableSplitTest(unittest.TestCase):
+    def test_report_with_hundreds_of_breaches_builds(self):
+        pdf = generate_pdf_bytes(
+            business_name="Acme Ltd",
+            email="a@b.com",
+            website="b.com",
+            hibp=_hibp_with_breaches(300),
+            ssl={"raw": {}},
+            last_reviewed="01/02/2024",
+        )
+        self.assertTrue(pdf.startswith(b"%PDF"))
+
+    def test_split_keeps_every_line_and_fits(self):
+        breaches = ", ".join(f"Breach{i}" for i in range(300))
+        table = _DetailTable([("Email", "a@b.com"), ("Breaches", breaches)], _DETAIL_COLWIDTHS)
+        all_lines = [line for row in table._body for line in row[1]]
+
+        parts, avail = [], 300
+        while table.height > avail:
+            head, table = table.split(table.width, avail)
+            self.assertLessEqual(head.height, avail)
+            parts.append(head)
+        parts.append(table)
+
+        self.assertGreater(len(parts), 2)
+        split_lines = [line for part in parts for row in part._body for line in row[1] if line]
+        self.assertEqual(split_lines, all_lines)
+
+
+class LoadJsonTest(unittest.TestCase):
+    def test_wide_integer_stays_exact(self):
+        for text in ('{"a": 123456789012345678901234}', b'{"a": [-123456789012345678901234]}'):
+            data = load_json_from_text(text)
+            value = data["a"][0] if isinstance(data["a"], list) else data["a"]
+            self.assertIsInstance(value, int)
+            self.assertEqual(abs(value), 123456789012345678901234)
+
+    def test_small_float_uses_fast_path(self):
+        text = b'{"a": 0.00012345678901234567, "b": [-0.00012345678901234567]}'
+        self.assertFalse(_may_have_wide_int(text))
+        self.assertEqual(load_json_from_text(text)["a"], 0.00012345678901234567)
+
+    def test_nan_and_infinity(self):
+        for text in ('{"a": NaN, "b": Infinity}', b'{"a": NaN, "b": -Infinity}'):
+            data = load_json_from_text(text)
+            self.assertTrue(math.isnan(data["a"]))
+            self.assertTrue(math.isinf(data["b"]))
+
+    def test_non_utf8_bytes(self):
+        self.assertEqual(load_json_from_text(b'{"a": "caf\xe9"}'), {"a": "caf\ufffd"})
+
+    def test_header_and_memoryview_slice(self):
+        text = b"# exported from scanner\n{\"a\": {\"$numberLong\": \"2\"}}"
+        raw = _strip_to_json(text)
+        self.assertIsInstance(raw, memoryview)  # header skipped without copying
+        self.assertEqual(bytes(raw), text[text.index(b"{") :])
+        self.assertEqual(load_json_from_text(text), {"a": 2})
+
+    def test_invalid_json_raises(self):
+        with self.assertRaises(ValueError):
+            load_json_from_text('{"a": }')
+        with self.assertRaises(ValueError):
+            load_json_from_text("no json here")
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_non_finite_floats_differ_from_null(self):
+        keys = {
+            _dumps_sorted(["Acme", {"email": value}])
+            for value in (None, float("nan"), float("inf"), float("-inf"), "null")
+        }
+        self.assertEqual(len(keys), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()